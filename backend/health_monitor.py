@@ -82,6 +82,7 @@ class HealthMonitor:
         circuit_breaker=None,
         retry_tracker=None,
         failure_window_seconds: int = 3600,
+        resource_cache_ttl_seconds: float = 0.5,
     ):
         """
         Initialize health monitor.
@@ -90,10 +91,13 @@ class HealthMonitor:
             circuit_breaker: Optional CircuitBreaker instance from issue #14
             retry_tracker: Optional retry failure tracker from issue #15
             failure_window_seconds: Time window for retry failure tracking (default: 1 hour)
+            resource_cache_ttl_seconds: How long a resource health sample is reused
+                before psutil is queried again (default: 0.5s)
         """
         self.cb = circuit_breaker
         self.retry_tracker = retry_tracker
         self.failure_window_seconds = failure_window_seconds
+        self.resource_cache_ttl_seconds = resource_cache_ttl_seconds
 
         self.fallback_mode = FallbackMode.PRIMARY
         self.component_health = SystemHealthMonitor()
@@ -104,6 +108,11 @@ class HealthMonitor:
         self._retry_failures: List[datetime] = []
         self._fallback_cascade_log: List[Dict[str, Any]] = []
 
+        # Resource health sampling is slow (psutil CPU sampling); reuse recent results
+        self._resource_cache: Optional[Dict[str, Any]] = None
+        self._resource_cache_ts = 0.0
+        self._resource_cache_lock = Lock()
+
         logger.info("HealthMonitor initialized")
 
     async def get_comprehensive_state(self) -> Dict[str, Any]:
@@ -116,9 +125,11 @@ class HealthMonitor:
         start = time.time()
 
         try:
+            # One snapshot of component health feeds both "system" and "components"
+            component_status = self.component_health.get_system_status(include_components=True)
             state = {
                 "timestamp": datetime.utcnow().isoformat(),
-                "system": self._get_system_health(),
+                "system": self._get_system_health(component_status),
                 "circuit_breaker": self._get_circuit_breaker_state(),
                 "retry": self._get_retry_metrics(),
                 "resources": self._get_resource_health(),
@@ -126,7 +137,7 @@ class HealthMonitor:
                     "mode": self.fallback_mode.value,
                     "cascade_log": self._fallback_cascade_log[-10:],  # Last 10 entries
                 },
-                "components": self._get_components_health(),
+                "components": component_status["components"],
                 "uptime_seconds": self._get_uptime_seconds(),
             }
 
@@ -138,27 +149,35 @@ class HealthMonitor:
             logger.error(f"Error in get_comprehensive_state: {e}", exc_info=True)
             raise
 
-    def _get_system_health(self) -> Dict[str, Any]:
-        """Get overall system health status."""
-        statuses = [c.status for c in self.component_health._components.values()]
+    def _get_system_health(
+        self, component_status: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Get overall system health status.
+
+        Args:
+            component_status: Optional pre-fetched SystemHealthMonitor status
+                or summary; fetched if omitted
+        """
+        if component_status is None:
+            component_status = self.component_health.get_system_summary()
+        counts = component_status["component_counts"]
 
-        if not statuses:
+        if not counts["total"]:
             overall = HealthStatus.UNKNOWN.value
-        elif HealthStatus.FAILED in statuses:
+        elif counts["failed"]:
             overall = HealthStatus.FAILED.value
-        elif HealthStatus.DEGRADED in statuses:
+        elif counts["degraded"]:
             overall = HealthStatus.DEGRADED.value
         else:
             overall = HealthStatus.HEALTHY.value
 
         return {
             "status": overall,
-            "healthy_components": sum(1 for s in statuses if s == HealthStatus.HEALTHY),
-            "degraded_components": sum(
-                1 for s in statuses if s == HealthStatus.DEGRADED
-            ),
-            "failed_components": sum(1 for s in statuses if s == HealthStatus.FAILED),
-            "total_components": len(statuses),
+            "healthy_components": counts["healthy"],
+            "degraded_components": counts["degraded"],
+            "failed_components": counts["failed"],
+            "total_components": counts["total"],
         }
 
     def _get_circuit_breaker_state(self) -> Dict[str, Any]:
@@ -233,40 +252,48 @@ class HealthMonitor:
                 ),
             }
 
-    def _get_components_health(self) -> Dict[str, Dict[str, Any]]:
-        """Get health status of all registered components."""
-        result = {}
-        for name, health in self.component_health._components.items():
-            result[name] = health.to_dict()
-        return result
-
     def _get_uptime_seconds(self) -> float:
         """Get system uptime in seconds."""
         return (datetime.utcnow() - self.start_time).total_seconds()
 
     def _get_resource_health(self) -> Dict[str, Any]:
-        """Get resource monitoring status."""
-        try:
-            resource_status = self.resource_monitor.check_resource_health()
-            current_metrics = self.resource_monitor.get_current_metrics()
+        """
+        Get resource monitoring status.
 
-            return {
-                "status": resource_status,
-                "current_metrics": current_metrics.to_dict(),
-                "available": True
-            }
-        except Exception as e:
-            logger.error(f"Error getting resource health: {e}", exc_info=False)
-            return {
-                "status": {
-                    "cpu": "unknown",
-                    "memory": "unknown",
-                    "disk": "unknown",
-                    "overall": "unknown"
-                },
-                "current_metrics": {},
-                "available": False
-            }
+        Successful samples are reused for ``resource_cache_ttl_seconds`` so
+        high-frequency dashboard polling doesn't hammer psutil.
+        """
+        with self._resource_cache_lock:
+            now = time.monotonic()
+            if (
+                self._resource_cache is not None
+                and now - self._resource_cache_ts < self.resource_cache_ttl_seconds
+            ):
+                return self._resource_cache
+
+            try:
+                resource_status = self.resource_monitor.check_resource_health()
+                current_metrics = self.resource_monitor.get_current_metrics()
+
+                self._resource_cache = {
+                    "status": resource_status,
+                    "current_metrics": current_metrics.to_dict(),
+                    "available": True
+                }
+                self._resource_cache_ts = now
+                return self._resource_cache
+            except Exception as e:
+                logger.error(f"Error getting resource health: {e}", exc_info=False)
+                return {
+                    "status": {
+                        "cpu": "unknown",
+                        "memory": "unknown",
+                        "disk": "unknown",
+                        "overall": "unknown"
+                    },
+                    "current_metrics": {},
+                    "available": False
+                }
 
     def record_retry_failure(self):
         """Record a retry failure for tracking."""
@@ -5,15 +5,29 @@ Provides centralized health status for all components,
 allowing the dashboard and other consumers to query system state.
 """
 
+import functools
 import logging
+import sys
+import time
+from collections import Counter
 from enum import Enum
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field, replace
 from datetime import datetime
-from typing import Dict, Optional, List
+from types import MappingProxyType
+from typing import Dict, Mapping, NamedTuple, Optional, List
 from threading import Lock, RLock
 
 logger = logging.getLogger(__name__)
 
+# dataclass(slots=True) needs Python 3.10+; older interpreters keep __dict__
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+def _ns_to_iso(timestamp_ns: int) -> str:
+    """Format a time.time_ns() timestamp as local-time ISO 8601."""
+    seconds, nanos = divmod(timestamp_ns, 1_000_000_000)
+    return datetime.fromtimestamp(seconds).replace(microsecond=nanos // 1000).isoformat()
+
 
 class HealthStatus(Enum):
     """Health status levels for components."""
@@ -23,32 +37,59 @@ class HealthStatus(Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class ComponentHealth:
-    """Health status of a single component."""
+    """
+    Health status of a single component.
+    
+    Timestamps are integer nanoseconds since the epoch (``time.time_ns()``)
+    and are only converted to ISO strings in ``to_dict``.
+    
+    SystemHealthMonitor never mutates a published instance (updates go
+    through ``dataclasses.replace``), so the serialized form is built once
+    per instance and reused by every ``to_dict`` call.
+    """
     name: str
     status: HealthStatus
-    last_updated: datetime
+    last_updated: int
     error_count: int = 0
     warning_count: int = 0
     last_error: Optional[str] = None
-    last_error_time: Optional[datetime] = None
+    last_error_time: Optional[int] = None
     fallback_active: bool = False
     metadata: Optional[Dict] = None
+    _cached_dict: Optional[Dict] = field(default=None, init=False, repr=False, compare=False)
     
     def to_dict(self) -> Dict:
-        """Convert to dictionary for JSON serialization."""
-        return {
-            "name": self.name,
-            "status": self.status.value,
-            "last_updated": self.last_updated.isoformat(),
-            "error_count": self.error_count,
-            "warning_count": self.warning_count,
-            "last_error": self.last_error,
-            "last_error_time": self.last_error_time.isoformat() if self.last_error_time else None,
-            "fallback_active": self.fallback_active,
-            "metadata": self.metadata or {},
-        }
+        """
+        Convert to dictionary for JSON serialization.
+        
+        Returns a shallow copy of the cached dict so callers may add or
+        replace keys; nested ``metadata`` is shared and must not be mutated.
+        """
+        if self._cached_dict is None:
+            self._cached_dict = {
+                "name": self.name,
+                "status": self.status.value,
+                "last_updated": _ns_to_iso(self.last_updated),
+                "error_count": self.error_count,
+                "warning_count": self.warning_count,
+                "last_error": self.last_error,
+                "last_error_time": _ns_to_iso(self.last_error_time) if self.last_error_time else None,
+                "fallback_active": self.fallback_active,
+                "metadata": self.metadata or {},
+            }
+        return self._cached_dict.copy()
+
+
+class _HealthSnapshot(NamedTuple):
+    """Immutable monitor state; writers replace it as a whole."""
+    components: Mapping[str, ComponentHealth]
+    status_counts: Counter
+    system_status: HealthStatus
+
+
+_EMPTY_SNAPSHOT = _HealthSnapshot(MappingProxyType({}), Counter(), HealthStatus.HEALTHY)
 
 
 class SystemHealthMonitor:
@@ -57,6 +98,11 @@ class SystemHealthMonitor:
     
     Thread-safe singleton that tracks component health and allows
     queries about system state.
+
+    State is copy-on-write: writers build a new _HealthSnapshot (with new
+    ComponentHealth objects) under the lock and swap it in with a single
+    assignment, so readers see components, counts and overall status
+    from the same generation without locking.
     """
     
     _instance: Optional['SystemHealthMonitor'] = None
@@ -77,11 +123,18 @@ class SystemHealthMonitor:
             return
         
         self._initialized = True
-        self._components: Dict[str, ComponentHealth] = {}
-        self._component_lock = RLock()  # Use RLock for reentrant access
-        self._system_status = HealthStatus.HEALTHY
+        self._snapshot = _EMPTY_SNAPSHOT
+        self._component_lock = RLock()  # Serializes writers; readers use the snapshot
         logger.debug("SystemHealthMonitor initialized")
     
+    @property
+    def _components(self) -> Mapping[str, ComponentHealth]:
+        return self._snapshot.components
+    
+    @property
+    def _system_status(self) -> HealthStatus:
+        return self._snapshot.system_status
+    
     def register_component(self, name: str, metadata: Optional[Dict] = None):
         """
         Register a new component for monitoring.
@@ -91,14 +144,45 @@ class SystemHealthMonitor:
             metadata: Optional metadata about the component
         """
         with self._component_lock:
-            self._components[name] = ComponentHealth(
+            self._publish(name, ComponentHealth(
                 name=name,
                 status=HealthStatus.HEALTHY,
-                last_updated=datetime.now(),
+                last_updated=time.time_ns(),
                 metadata=metadata or {},
-            )
+            ))
             logger.debug(f"Registered component: {name}")
     
+    def _publish(self, name: str, health: ComponentHealth, refresh_status: bool = False):
+        """Swap in a new snapshot with ``health`` stored under ``name``.
+
+        Must be called with ``_component_lock`` held. Status counts are
+        adjusted incrementally so nothing has to rescan the components.
+        
+        Args:
+            name: Component name
+            health: New health record for the component
+            refresh_status: Recompute the overall system status as well
+        """
+        snapshot = self._snapshot
+        previous = snapshot.components.get(name)
+        counts = snapshot.status_counts.copy()
+        if previous is not None:
+            counts[previous.status] -= 1
+        counts[health.status] += 1
+        components = MappingProxyType({**snapshot.components, name: health})
+        system_status = (
+            self._compute_system_status(components, counts)
+            if refresh_status else snapshot.system_status
+        )
+        self._snapshot = _HealthSnapshot(components, counts, system_status)
+    
+    @staticmethod
+    def _merged_metadata(health: ComponentHealth, metadata: Optional[Dict]) -> Optional[Dict]:
+        """Return metadata for the next snapshot without mutating the current one."""
+        if not metadata:
+            return health.metadata
+        return {**(health.metadata or {}), **metadata}
+    
     def mark_healthy(self, component: str, metadata: Optional[Dict] = None):
         """
         Mark a component as healthy.
@@ -112,13 +196,14 @@ class SystemHealthMonitor:
                 self.register_component(component, metadata)
             
             health = self._components[component]
-            health.status = HealthStatus.HEALTHY
-            health.last_updated = datetime.now()
-            health.fallback_active = False
-            if metadata:
-                health.metadata.update(metadata)
+            self._publish(component, replace(
+                health,
+                status=HealthStatus.HEALTHY,
+                last_updated=time.time_ns(),
+                fallback_active=False,
+                metadata=self._merged_metadata(health, metadata),
+            ), refresh_status=True)
             
-            self._update_system_status()
             logger.debug(f"Component {component} marked healthy")
     
     def mark_degraded(self, component: str, error_msg: Optional[str] = None,
@@ -137,16 +222,18 @@ class SystemHealthMonitor:
                 self.register_component(component, metadata)
             
             health = self._components[component]
-            health.status = HealthStatus.DEGRADED
-            health.warning_count += 1
-            health.last_error = error_msg
-            health.last_error_time = datetime.now()
-            health.last_updated = datetime.now()
-            health.fallback_active = fallback_active
-            if metadata:
-                health.metadata.update(metadata)
+            now = time.time_ns()
+            self._publish(component, replace(
+                health,
+                status=HealthStatus.DEGRADED,
+                warning_count=health.warning_count + 1,
+                last_error=error_msg,
+                last_error_time=now,
+                last_updated=now,
+                fallback_active=fallback_active,
+                metadata=self._merged_metadata(health, metadata),
+            ), refresh_status=True)
             
-            self._update_system_status()
             logger.warning(f"Component {component} marked degraded: {error_msg}")
     
     def mark_failed(self, component: str, error_msg: Optional[str] = None,
@@ -164,31 +251,32 @@ class SystemHealthMonitor:
                 self.register_component(component, metadata)
             
             health = self._components[component]
-            health.status = HealthStatus.FAILED
-            health.error_count += 1
-            health.last_error = error_msg
-            health.last_error_time = datetime.now()
-            health.last_updated = datetime.now()
-            if metadata:
-                health.metadata.update(metadata)
+            now = time.time_ns()
+            self._publish(component, replace(
+                health,
+                status=HealthStatus.FAILED,
+                error_count=health.error_count + 1,
+                last_error=error_msg,
+                last_error_time=now,
+                last_updated=now,
+                metadata=self._merged_metadata(health, metadata),
+            ), refresh_status=True)
             
-            self._update_system_status()
             logger.error(f"Component {component} marked failed: {error_msg}")
     
-    def _update_system_status(self):
-        """Update overall system status based on component statuses."""
-        if not self._components:
-            self._system_status = HealthStatus.UNKNOWN
-            return
-        
-        statuses = [c.status for c in self._components.values()]
+    @staticmethod
+    def _compute_system_status(components: Mapping[str, ComponentHealth],
+                               counts: Counter) -> HealthStatus:
+        """Derive overall system status from component status counts."""
+        if not components:
+            return HealthStatus.UNKNOWN
         
-        if any(s == HealthStatus.FAILED for s in statuses):
-            self._system_status = HealthStatus.DEGRADED  # System is degraded if any component fails
-        elif any(s == HealthStatus.DEGRADED for s in statuses):
-            self._system_status = HealthStatus.DEGRADED
+        if counts[HealthStatus.FAILED]:
+            return HealthStatus.DEGRADED  # System is degraded if any component fails
+        elif counts[HealthStatus.DEGRADED]:
+            return HealthStatus.DEGRADED
         else:
-            self._system_status = HealthStatus.HEALTHY
+            return HealthStatus.HEALTHY
     
     def get_component_health(self, component: str) -> ComponentHealth:
         """
@@ -200,17 +288,23 @@ class SystemHealthMonitor:
         Returns:
             ComponentHealth object (auto-registers with UNKNOWN if not found)
         """
+        health = self._components.get(component)
+        if health is not None:
+            return health
+        
         with self._component_lock:
             # Auto-register if not found to ensure never-None contract
-            if component not in self._components:
-                self._components[component] = ComponentHealth(
+            health = self._components.get(component)
+            if health is None:
+                health = ComponentHealth(
                     name=component,
                     status=HealthStatus.UNKNOWN,
-                    last_updated=datetime.now(),
+                    last_updated=time.time_ns(),
                     metadata={},
                 )
+                self._publish(component, health)
                 logger.debug(f"Auto-registered component {component} with UNKNOWN status")
-            return self._components[component]
+            return health
     
     def get_all_health(self) -> Dict[str, Dict]:
         """
@@ -219,51 +313,66 @@ class SystemHealthMonitor:
         Returns:
             Dictionary mapping component names to their health dicts
         """
-        with self._component_lock:
-            return {name: health.to_dict() for name, health in self._components.items()}
+        return self._serialize_components(self._snapshot)
+    
+    def get_system_summary(self) -> Dict:
+        """
+        Get overall status and component counts only.
+        
+        Cheapest status query; intended for high-frequency polling.
+        
+        Returns:
+            Dictionary with overall status and per-status component counts
+        """
+        return self._summarize(self._snapshot)
     
-    def get_system_status(self) -> Dict:
+    @staticmethod
+    def _serialize_components(snapshot: _HealthSnapshot) -> Dict[str, Dict]:
+        return {name: health.to_dict() for name, health in snapshot.components.items()}
+    
+    @staticmethod
+    def _summarize(snapshot: _HealthSnapshot) -> Dict:
+        counts = snapshot.status_counts
+        return {
+            "overall_status": snapshot.system_status.value,
+            "component_counts": {
+                "healthy": counts[HealthStatus.HEALTHY],
+                "degraded": counts[HealthStatus.DEGRADED],
+                "failed": counts[HealthStatus.FAILED],
+                "total": len(snapshot.components),
+            },
+        }
+    
+    def get_system_status(self, include_components: bool = False) -> Dict:
         """
         Get overall system health status.
         
+        Args:
+            include_components: Also serialize every component's health
+                under ``"components"``
+        
         Returns:
             Dictionary with system-level health info
         """
-        with self._component_lock:
-            healthy_count = sum(1 for c in self._components.values() 
-                              if c.status == HealthStatus.HEALTHY)
-            degraded_count = sum(1 for c in self._components.values() 
-                               if c.status == HealthStatus.DEGRADED)
-            failed_count = sum(1 for c in self._components.values() 
-                             if c.status == HealthStatus.FAILED)
-            
-            return {
-                "overall_status": self._system_status.value,
-                "timestamp": datetime.now().isoformat(),
-                "component_counts": {
-                    "healthy": healthy_count,
-                    "degraded": degraded_count,
-                    "failed": failed_count,
-                    "total": len(self._components),
-                },
-                "components": self.get_all_health(),
-            }
+        snapshot = self._snapshot
+        status = self._summarize(snapshot)
+        status["timestamp"] = datetime.now().isoformat()
+        if include_components:
+            status["components"] = self._serialize_components(snapshot)
+        return status
     
     def is_system_healthy(self) -> bool:
         """Check if system is in healthy state."""
-        with self._component_lock:
-            return self._system_status == HealthStatus.HEALTHY
+        return self._system_status == HealthStatus.HEALTHY
     
     def is_system_degraded(self) -> bool:
         """Check if system is in degraded state."""
-        with self._component_lock:
-            return self._system_status == HealthStatus.DEGRADED
+        return self._system_status == HealthStatus.DEGRADED
     
     def reset(self):
         """Reset all health monitoring (for testing)."""
         with self._component_lock:
-            self._components.clear()
-            self._system_status = HealthStatus.HEALTHY
+            self._snapshot = _EMPTY_SNAPSHOT
             # Allow reinitialization after reset
             self._initialized = False
             logger.info("Health monitor reset")
@@ -272,18 +381,11 @@ class SystemHealthMonitor:
         # This ensures new instances get properly initialized after reset
         with self._init_lock:
             SystemHealthMonitor._instance = None
-            # Also reset the module-level _health_monitor
-            global _health_monitor
-            _health_monitor = None
-
-
-# Global instance - get via get_health_monitor()
-_health_monitor = None
+            # Also drop the instance cached by get_health_monitor()
+            get_health_monitor.cache_clear()
 
 
+@functools.cache
 def get_health_monitor() -> SystemHealthMonitor:
     """Get the global health monitor instance (singleton)."""
-    global _health_monitor
-    if _health_monitor is None:
-        _health_monitor = SystemHealthMonitor()
-    return _health_monitor
+    return SystemHealthMonitor()
@@ -3,6 +3,7 @@ Tests for Component Health module.
 """
 
 import pytest
+import time
 from datetime import datetime, timedelta
 from core.component_health import (
     HealthStatus,
@@ -16,7 +17,7 @@ class TestComponentHealth:
 
     def test_component_health_creation(self):
         """Test creating a ComponentHealth instance"""
-        now = datetime.now()
+        now = time.time_ns()
         health = ComponentHealth(
             name="test_component",
             status=HealthStatus.HEALTHY,
@@ -30,7 +31,7 @@ class TestComponentHealth:
 
     def test_component_health_to_dict(self):
         """Test ComponentHealth.to_dict() method"""
-        now = datetime.now()
+        now = time.time_ns()
         health = ComponentHealth(
             name="test_component",
             status=HealthStatus.HEALTHY,
@@ -6,6 +6,7 @@ and system-level health aggregation.
 """
 
 import pytest
+import sys
 import time
 from datetime import datetime
 from unittest.mock import patch
@@ -37,7 +38,7 @@ class TestComponentHealth:
         health = ComponentHealth(
             name="test_component",
             status=HealthStatus.HEALTHY,
-            last_updated=datetime.now(),
+            last_updated=time.time_ns(),
             error_count=2,
             warning_count=1,
             last_error="Test error",
@@ -58,7 +59,7 @@ class TestComponentHealth:
         health = ComponentHealth(
             name="test",
             status=HealthStatus.HEALTHY,
-            last_updated=datetime.now()
+            last_updated=time.time_ns()
         )
 
         assert health.error_count == 0
@@ -70,7 +71,7 @@ class TestComponentHealth:
 
     def test_to_dict(self):
         """Test ComponentHealth to_dict method"""
-        timestamp = datetime.now()
+        timestamp = time.time_ns()
         health = ComponentHealth(
             name="test",
             status=HealthStatus.DEGRADED,
@@ -92,6 +93,19 @@ class TestComponentHealth:
         assert "last_updated" in data
         assert "last_error_time" in data
 
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need Python 3.10+")
+    def test_uses_slots(self):
+        """Test ComponentHealth instances carry no per-instance __dict__"""
+        health = ComponentHealth(
+            name="test",
+            status=HealthStatus.HEALTHY,
+            last_updated=time.time_ns()
+        )
+
+        assert not hasattr(health, "__dict__")
+        with pytest.raises(AttributeError):
+            health.unexpected_attribute = True
+
 
 class TestSystemHealthMonitor:
     """Test SystemHealthMonitor singleton"""
@@ -172,6 +186,36 @@ class TestSystemHealthMonitor:
         assert health.error_count == 1
         assert health.last_error == "Critical error"
         assert health.last_error_time is not None
+        assert health.last_error_time == health.last_updated
+
+    def test_to_dict_timestamps_match_instance(self, monitor):
+        """Test that to_dict serializes the component's own timestamps"""
+        monitor.mark_failed("test_comp", "Critical error")
+        health = monitor.get_component_health("test_comp")
+
+        first = health.to_dict()
+        second = health.to_dict()
+
+        assert isinstance(health.last_updated, int)
+        parsed = datetime.fromisoformat(first["last_updated"]).timestamp()
+        assert parsed == pytest.approx(health.last_updated / 1e9, abs=1e-3)
+        assert first["last_error_time"] == first["last_updated"]
+        assert second == first
+
+    def test_to_dict_cache_isolated_from_callers(self, monitor):
+        """Test that callers editing to_dict output don't corrupt the cache"""
+        monitor.register_component("test_comp")
+        health = monitor.get_component_health("test_comp")
+
+        data = health.to_dict()
+        data["status"] = "DEGRADED"
+        data["details"] = "injected"
+
+        assert health.to_dict()["status"] == "healthy"
+        assert "details" not in health.to_dict()
+
+        monitor.mark_failed("test_comp", "Critical error")
+        assert monitor.get_all_health()["test_comp"]["status"] == "failed"
 
     def test_auto_registration_on_status_change(self, monitor):
         """Test that status changes auto-register unknown components"""
@@ -266,7 +310,7 @@ class TestSystemHealthMonitor:
         monitor.mark_degraded("comp2")
         monitor.mark_failed("comp3")
 
-        status = monitor.get_system_status()
+        status = monitor.get_system_status(include_components=True)
 
         assert status["overall_status"] == "degraded"
         assert "timestamp" in status
@@ -276,6 +320,36 @@ class TestSystemHealthMonitor:
         assert status["component_counts"]["total"] == 3
         assert len(status["components"]) == 3
 
+    def test_get_system_status_omits_components_by_default(self, monitor):
+        """Test components are only serialized when requested"""
+        monitor.register_component("comp1")
+        monitor.mark_failed("comp1", "Error")
+
+        status = monitor.get_system_status()
+        summary = monitor.get_system_summary()
+
+        assert "components" not in status
+        assert "timestamp" in status
+        assert summary == {
+            "overall_status": "degraded",
+            "component_counts": {"healthy": 0, "degraded": 0, "failed": 1, "total": 1},
+        }
+
+    def test_status_counts_follow_transitions(self, monitor):
+        """Test component counts stay correct as components change state"""
+        monitor.register_component("comp1")
+        monitor.mark_failed("comp1", "Error")
+        monitor.mark_degraded("comp1", "Recovering")
+        monitor.mark_healthy("comp1")
+        monitor.get_component_health("unknown_comp")
+
+        counts = monitor.get_system_status()["component_counts"]
+        assert counts["healthy"] == 1
+        assert counts["degraded"] == 0
+        assert counts["failed"] == 0
+        assert counts["total"] == 2
+        assert monitor.is_system_healthy()
+
     def test_reset_functionality(self, monitor):
         """Test reset clears all state"""
         monitor.register_component("comp1")
@@ -319,6 +393,22 @@ class TestSystemHealthMonitor:
         assert len(results) == 10
         assert len(monitor._components) == 10
 
+    def test_updates_do_not_mutate_previous_snapshot(self, monitor):
+        """Test that writers publish new objects instead of mutating readers' copies"""
+        monitor.register_component("test_comp", {"version": "1.0"})
+        before = monitor.get_component_health("test_comp")
+
+        monitor.mark_failed("test_comp", "Test error", metadata={"retry": 1})
+
+        assert before.status == HealthStatus.HEALTHY
+        assert before.error_count == 0
+        assert before.metadata == {"version": "1.0"}
+
+        after = monitor.get_component_health("test_comp")
+        assert after is not before
+        assert after.status == HealthStatus.FAILED
+        assert after.metadata == {"version": "1.0", "retry": 1}
+
 
 class TestGlobalFunctions:
     """Test global health monitor functions"""
@@ -326,8 +416,7 @@ class TestGlobalFunctions:
     def test_get_health_monitor_singleton(self):
         """Test get_health_monitor returns singleton"""
         # Reset global state
-        import core.component_health
-        core.component_health._health_monitor = None
+        get_health_monitor.cache_clear()
         SystemHealthMonitor._instance = None
 
         monitor1 = get_health_monitor()
@@ -339,8 +428,7 @@ class TestGlobalFunctions:
     def test_get_health_monitor_persistence(self):
         """Test get_health_monitor persists across calls"""
         # Reset global state
-        import core.component_health
-        core.component_health._health_monitor = None
+        get_health_monitor.cache_clear()
 
         monitor = get_health_monitor()
         monitor.register_component("test")
@@ -350,6 +438,17 @@ class TestGlobalFunctions:
         assert monitor2 is monitor
         assert "test" in monitor2._components
 
+    def test_reset_clears_cached_monitor(self):
+        """Test reset makes get_health_monitor return a fresh monitor"""
+        monitor = get_health_monitor()
+        monitor.register_component("test")
+
+        monitor.reset()
+        fresh = get_health_monitor()
+
+        assert fresh is not monitor
+        assert "test" not in fresh._components
+
 
 class TestIntegrationScenarios:
     """Test realistic integration scenarios"""
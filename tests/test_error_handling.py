@@ -172,7 +172,7 @@ class TestHealthMonitoring:
         monitor.register_component("comp1")
         monitor.mark_healthy("comp1")
         
-        status = monitor.get_system_status()
+        status = monitor.get_system_status(include_components=True)
         assert "overall_status" in status
         assert "component_counts" in status
         assert "components" in status
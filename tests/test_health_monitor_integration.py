@@ -683,6 +683,48 @@ async def test_resource_monitoring_error_handling(health_monitor):
         health_monitor.resource_monitor = original_monitor
 
 
+@pytest.mark.asyncio
+async def test_system_and_components_share_snapshot(health_monitor):
+    """Test system counts agree with the component map in one state."""
+    component_health = health_monitor.component_health
+    component_health.mark_healthy("snapshot_ok")
+    component_health.mark_failed("snapshot_bad", "Test error")
+
+    try:
+        state = await health_monitor.get_comprehensive_state()
+
+        system = state["system"]
+        assert system["status"] == HealthStatus.FAILED.value
+        assert system["total_components"] == len(state["components"])
+        assert system["failed_components"] == sum(
+            1 for c in state["components"].values() if c["status"] == "failed"
+        )
+    finally:
+        component_health.reset()
+
+
+@pytest.mark.asyncio
+async def test_resource_monitoring_cached_within_ttl(health_monitor):
+    """Test resource health is sampled once per TTL window."""
+    mock_monitor = Mock()
+    mock_monitor.check_resource_health.return_value = {
+        "cpu": "healthy", "memory": "healthy", "disk": "healthy", "overall": "healthy"
+    }
+    mock_monitor.get_current_metrics.return_value.to_dict.return_value = {"cpu_percent": 1.0}
+    health_monitor.resource_monitor = mock_monitor
+    health_monitor.resource_cache_ttl_seconds = 60
+
+    first = await health_monitor.get_comprehensive_state()
+    second = await health_monitor.get_comprehensive_state()
+
+    assert first["resources"] == second["resources"]
+    assert mock_monitor.check_resource_health.call_count == 1
+
+    health_monitor.resource_cache_ttl_seconds = 0
+    await health_monitor.get_comprehensive_state()
+    assert mock_monitor.check_resource_health.call_count == 2
+
+
 @pytest.mark.asyncio
 async def test_resource_monitoring_cascade_reason_logging(health_monitor, health_state_sample):
     """Test cascade logs resource exhaustion reasons."""
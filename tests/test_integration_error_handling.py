@@ -289,7 +289,7 @@ class TestHealthStatusExposure:
         monitor.mark_healthy("anomaly_detector")
         monitor.mark_degraded("policy_engine", "Config error")
         
-        status = monitor.get_system_status()
+        status = monitor.get_system_status(include_components=True)
         
         # Dashboard should be able to display this
         assert status['overall_status'] in ['healthy', 'degraded', 'failed']